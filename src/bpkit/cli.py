@@ -1,17 +1,17 @@
 """Blueprint CLI - Command-line interface for bpkit."""
 
-import click
+import argparse
 
-from bpkit.commands.vault import vault
+from bpkit.commands.vault import add_vault_parser
 
 
-@click.group()
-def bp():
+def bp() -> None:
     """Blueprint development kit CLI."""
-    pass
-
-
-bp.add_command(vault)
+    parser = argparse.ArgumentParser(prog="bp", description="Blueprint development kit CLI.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    add_vault_parser(subparsers)
+    args = parser.parse_args()
+    args.func(args)
 
 
 if __name__ == "__main__":
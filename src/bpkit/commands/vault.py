@@ -1,55 +1,56 @@
 """Vault commands for secret management."""
 
-import click
-
-from bpkit.vault import generate_password
-
-
-@click.group()
-def vault():
-    """Vault operations for secret management."""
-    pass
-
-
-@vault.group()
-def gen():
-    """Generate cryptographic artifacts."""
-    pass
-
-
-@gen.command(name="pass")
-@click.option(
-    "--length",
-    "-l",
-    default=32,
-    type=int,
-    help="Length of the password (default: 32)",
-)
-@click.option(
-    "--no-letters",
-    is_flag=True,
-    help="Exclude letters from password",
-)
-@click.option(
-    "--no-digits",
-    is_flag=True,
-    help="Exclude digits from password",
-)
-@click.option(
-    "--no-symbols",
-    is_flag=True,
-    help="Exclude symbols from password",
-)
-def generate_pass(length: int, no_letters: bool, no_digits: bool, no_symbols: bool):
+import argparse
+import sys
+
+
+def add_vault_parser(subparsers: argparse._SubParsersAction) -> None:
+    """Register the vault command tree on the top-level subparsers."""
+    vault = subparsers.add_parser("vault", help="Vault operations for secret management.")
+    vault_sub = vault.add_subparsers(dest="vault_command", required=True)
+
+    gen = vault_sub.add_parser("gen", help="Generate cryptographic artifacts.")
+    gen_sub = gen.add_subparsers(dest="gen_command", required=True)
+
+    gen_pass = gen_sub.add_parser("pass", help="Generate a cryptographically secure random password.")
+    gen_pass.add_argument(
+        "--length",
+        "-l",
+        default=32,
+        type=int,
+        help="Length of the password (default: 32)",
+    )
+    gen_pass.add_argument(
+        "--no-letters",
+        action="store_true",
+        help="Exclude letters from password",
+    )
+    gen_pass.add_argument(
+        "--no-digits",
+        action="store_true",
+        help="Exclude digits from password",
+    )
+    gen_pass.add_argument(
+        "--no-symbols",
+        action="store_true",
+        help="Exclude symbols from password",
+    )
+    gen_pass.set_defaults(func=generate_pass)
+
+
+def generate_pass(args: argparse.Namespace) -> None:
     """Generate a cryptographically secure random password."""
+    # Imported here so parser construction and --help stay import-free.
+    from bpkit.vault import generate_password
+
     try:
         password = generate_password(
-            length=length,
-            use_letters=not no_letters,
-            use_digits=not no_digits,
-            use_symbols=not no_symbols,
+            length=args.length,
+            use_letters=not args.no_letters,
+            use_digits=not args.no_digits,
+            use_symbols=not args.no_symbols,
         )
-        click.echo(password)
     except ValueError as e:
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort from e
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(password)
@@ -1,9 +1,18 @@
+import functools
+import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Optional, Union
 
 import yaml
 from pydantic import BaseModel, EmailStr
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # LibYAML bindings not compiled in
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class Profile(BaseModel):
     username: str
@@ -52,10 +61,53 @@ class Config(BaseModel):
     github_secrets: Optional[list[dict]] = None
 
 
+def _read_cache(cache_path: Path, header: str) -> Optional[dict]:
+    """Return cached config data if the cache header matches, else None."""
+    try:
+        with open(cache_path) as f:
+            if f.readline().rstrip("\n") != header:
+                return None
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_cache(cache_path: Path, header: str, data: dict) -> None:
+    """Atomically write the parsed config as JSON behind a freshness header."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name)
+        with os.fdopen(fd, "w") as f:
+            f.write(header + "\n")
+            json.dump(data, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Cache is best-effort; next run falls back to YAML.
+
+
+def _construct_config(data: dict) -> Config:
+    """Rebuild a Config from already-validated cache data without revalidating."""
+    return Config.model_construct(
+        profiles={name: Profile.model_construct(**profile) for name, profile in data["profiles"].items()},
+        default_user_profile=data["default_user_profile"],
+        git_repos=[GitRepo.model_construct(**repo) for repo in data["git_repos"]],
+        ssh=SSHConfig.model_construct(**data["ssh"]),
+        gpg=GPGConfig.model_construct(**data["gpg"]),
+        win_user={name: WinUser.model_construct(**user) for name, user in data["win_user"].items()},
+        user_apt_packages=data["user_apt_packages"],
+        known_hosts=[KnownHost.model_construct(**host) for host in data["known_hosts"]],
+        secret_files=data.get("secret_files"),
+        github_secrets=data.get("github_secrets"),
+    )
+
+
 def load_config(file_path: Union[str, Path]) -> Config:
     """
     Load and validate configuration from YAML file.
 
+    A JSON sidecar cache (`<file>.cache.json`) keyed by the YAML's mtime
+    and size skips the YAML parse entirely when the file is unchanged.
+
     Args:
         file_path: Path to the YAML configuration file
 
@@ -67,13 +119,38 @@ def load_config(file_path: Union[str, Path]) -> Config:
         FileNotFoundError: If the file doesn't exist
         yaml.YAMLError: If the YAML is malformed
     """
-    with open(file_path) as f:
-        data = yaml.safe_load(f)
+    file_path = Path(file_path)
+    stat = os.stat(file_path)
+    cache_path = file_path.with_name(file_path.name + ".cache.json")
+    header = f"# mtime:{stat.st_mtime_ns}:{stat.st_size}"
 
-    return Config(**data)
+    data = _read_cache(cache_path, header)
+    if data is not None:
+        try:
+            return _construct_config(data)
+        except (KeyError, TypeError, AttributeError):
+            pass  # Stale or corrupt cache; fall through to the full parse.
+
+    data = yaml.load(file_path.read_bytes(), Loader=_YamlLoader)
+    config = Config(**data)
+    # Cache the validated model so the warm path can skip revalidation.
+    _write_cache(cache_path, header, config.model_dump(mode="json"))
+    return config
 
 
 # Configuration
 CONFIG_HOME = Path.home() / ".config" / "blueprint"
 
-blueprint_config = load_config(CONFIG_HOME / "config.yaml")
+
+@functools.cache
+def get_blueprint_config() -> Config:
+    """Load the user configuration on first access and cache it."""
+    return load_config(CONFIG_HOME / "config.yaml")
+
+
+def __getattr__(name: str) -> Config:
+    # PEP 562: keep `blueprint_config` importable without paying for the
+    # YAML parse on every `import bpkit.config`.
+    if name == "blueprint_config":
+        return get_blueprint_config()
+    raise AttributeError(name)
@@ -3,19 +3,37 @@ GPG-based secret encryption/decryption utility.
 Processes data in memory without temporary files.
 """
 
-import json
 import os
-import secrets as secretslib
 import shutil
 import string
 import subprocess
 import sys
+from functools import cache
 from pathlib import Path
 
-from bpkit.config import blueprint_config
+import yaml
+
+from bpkit.config import _YamlLoader, get_blueprint_config
+
+try:
+    # GPGME bindings; shipped with system gpgme, not PyPI
+    import gpg as gpgme  # type: ignore[import-not-found]
+except ImportError:  # fall back to spawning the gpg binary
+    gpgme = None
+
+_GPGME_ERRORS = (gpgme.errors.GpgError,) if gpgme is not None else ()
 
 SECRETS_DIR = Path.home() / ".config" / "blueprint" / "secrets"
 
+# All eight character-set combinations for generate_password, indexed by
+# (use_letters << 2) | (use_digits << 1) | use_symbols.
+_CHARSETS = tuple(
+    (string.ascii_letters if key & 4 else "")
+    + (string.digits if key & 2 else "")
+    + (string.punctuation if key & 1 else "")
+    for key in range(8)
+)
+
 
 class GPGNotFoundError(FileNotFoundError):
     """Raised when gpg command is not found in system PATH."""
@@ -31,22 +49,40 @@ class GPGKeyNotConfiguredError(ValueError):
         super().__init__("GPG key not configured")
 
 
+@cache
+def _translate_table(alphabet: bytes) -> bytes:
+    """256-byte table mapping any byte onto a power-of-two-sized alphabet."""
+    mask = len(alphabet) - 1
+    return bytes(alphabet[i & mask] for i in range(256))
+
+
+@cache
+def _gpgme_context():
+    """Build one in-process GPGME context, reused across operations."""
+    return gpgme.Context(armor=True)
+
+
+@cache
 def get_gpg_path() -> str:
-    """Get the full path to the gpg executable."""
+    """Get the full path to the gpg executable (cached per process)."""
     gpg_path = shutil.which("gpg")
     if not gpg_path:
         raise GPGNotFoundError
     return gpg_path
 
 
+@cache
 def user_gpg_key() -> str:
     """
     Retrieve the user's GPG key identifier from environment variable or use default.
 
+    Cached for the process lifetime, so ``BP_GPG_KEY`` must be set before
+    the first call (always the case for CLI use).
+
     Returns:
         GPG key identifier as a string.
     """
-    user_key = os.getenv("BP_GPG_KEY", blueprint_config.gpg.key)
+    user_key = os.getenv("BP_GPG_KEY") or get_blueprint_config().gpg.key
     if not user_key:
         raise GPGKeyNotConfiguredError
     return user_key
@@ -77,22 +113,33 @@ def generate_password(
         msg = "Password length must be at least 1"
         raise ValueError(msg)
 
-    # Build character set
-    chars = ""
-    if use_letters:
-        chars += string.ascii_letters
-    if use_digits:
-        chars += string.digits
-    if use_symbols:
-        chars += string.punctuation
+    # Look up the precomputed character set
+    chars = _CHARSETS[(bool(use_letters) << 2) | (bool(use_digits) << 1) | bool(use_symbols)]
 
     if not chars:
         msg = "At least one character set must be selected"
         raise ValueError(msg)
 
-    # Generate password using cryptographically secure random
-    password = "".join(secretslib.choice(chars) for _ in range(length))
-    return password
+    # Generate password using cryptographically secure random.
+    # Pull one os.urandom buffer and reject bytes outside the alphabet
+    # instead of calling secrets.choice once per character.
+    alphabet = chars.encode("ascii")
+    n = len(alphabet)
+    if n & (n - 1) == 0:
+        # Power-of-two alphabet: masking each byte is uniform by
+        # construction, so the whole password is one urandom call plus
+        # one C-level translate with no Python loop.
+        return os.urandom(length).translate(_translate_table(alphabet)).decode("ascii")
+    mask = (1 << (n - 1).bit_length()) - 1
+    password = bytearray()
+    while len(password) < length:
+        for byte in os.urandom(max(length * 2, 32)):
+            value = byte & mask
+            if value < n:
+                password.append(alphabet[value])
+                if len(password) == length:
+                    break
+    return password.decode("ascii")
 
 
 def encrypt_file(filename: str, gpg_key: str) -> None:
@@ -111,29 +158,39 @@ def encrypt_file(filename: str, gpg_key: str) -> None:
     # Create secrets directory if it doesn't exist
     SECRETS_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Read from stdin
-    input_data = sys.stdin.buffer.read()
+    output_path = SECRETS_DIR / f"{filename}.asc"
 
-    # Encrypt using GPG (process in memory)
+    # Encrypt using GPG, streaming stdin straight into gpg and gpg's
+    # output straight to disk so the payload never lands in Python memory.
+    # With the GPGME bindings the work happens in-process, skipping a
+    # fork/exec and gpg startup per call; otherwise spawn the gpg binary.
     try:
-        gpg_path = get_gpg_path()
-        # Safe: gpg_path from shutil.which, args are controlled, no shell execution
-        result = subprocess.run(  # noqa: S603
-            [gpg_path, "-e", "-r", gpg_key, "--armor"],
-            input=input_data,
-            capture_output=True,
-            check=True,
-        )
-
-        # Write encrypted output to file
-        output_path = SECRETS_DIR / f"{filename}.asc"
-        output_path.write_bytes(result.stdout)
+        with open(output_path, "wb") as out_f:
+            if gpgme is not None:
+                ctx = _gpgme_context()
+                ctx.encrypt(sys.stdin.buffer, recipients=[ctx.get_key(gpg_key)], sign=False, sink=out_f)
+            else:
+                gpg_path = get_gpg_path()
+                # Safe: gpg_path from shutil.which, args are controlled, no shell execution
+                subprocess.run(  # noqa: S603
+                    [gpg_path, "-e", "-r", gpg_key, "--armor"],
+                    stdin=sys.stdin.buffer,
+                    stdout=out_f,
+                    stderr=subprocess.PIPE,
+                    check=True,
+                )
         print(f"Encrypted and saved to {output_path}")
 
     except subprocess.CalledProcessError as e:
+        output_path.unlink(missing_ok=True)
         print(f"Encryption failed: {e.stderr.decode()}", file=sys.stderr)
         sys.exit(1)
+    except _GPGME_ERRORS as e:
+        output_path.unlink(missing_ok=True)
+        print(f"Encryption failed: {e}", file=sys.stderr)
+        sys.exit(1)
     except FileNotFoundError:
+        output_path.unlink(missing_ok=True)
         print("Error: gpg command not found. Please install GnuPG.", file=sys.stderr)
         sys.exit(1)
 
@@ -149,34 +206,54 @@ def decrypt_file(filename: str) -> None:
         print("Please provide a file to decrypt.")
         sys.exit(1)
 
-    # Remove any trailing .asc extension if provided
-    filename = filename.rstrip(".asc")
+    # Remove any trailing .asc extension if provided. rstrip would treat
+    # ".asc" as a character set and eat the end of names like "pass".
+    filename = filename.removesuffix(".asc")
 
-    # Construct file path
+    # Construct file path and open it directly; catching the failed open
+    # replaces a separate exists()/stat round trip (EAFP). A missing gpg
+    # binary surfaces as GPGNotFoundError, keeping the two cases apart.
     file_path = SECRETS_DIR / f"{filename}.asc"
 
-    if not file_path.exists():
-        print(f"Error: File not found: {file_path}", file=sys.stderr)
-        sys.exit(1)
-
-    # Read encrypted file
-    encrypted_data = file_path.read_bytes()
-
-    # Decrypt using GPG (process in memory)
+    # Decrypt using GPG, streaming the ciphertext file straight into gpg
+    # and gpg's output straight to stdout with no Python-side buffering.
+    # Prefer the in-process GPGME context when the bindings are available.
     try:
-        gpg_path = get_gpg_path()
-        # Safe: gpg_path from shutil.which, args are controlled, no shell execution
-        result = subprocess.run([gpg_path, "--quiet", "-d"], input=encrypted_data, capture_output=True, check=True)  # noqa: S603
-
-        # Output decrypted data to stdout
-        sys.stdout.buffer.write(result.stdout)
+        with open(file_path, "rb") as in_f:
+            if gpgme is not None:
+                _gpgme_context().decrypt(in_f, sink=sys.stdout.buffer)
+            else:
+                gpg_path = get_gpg_path()
+                # Safe: gpg_path from shutil.which, args are controlled, no shell execution
+                subprocess.run(  # noqa: S603
+                    [gpg_path, "--quiet", "-d"],
+                    stdin=in_f,
+                    stdout=sys.stdout.buffer,
+                    stderr=subprocess.PIPE,
+                    check=True,
+                )
 
     except subprocess.CalledProcessError as e:
         print(f"Decryption failed: {e.stderr.decode()}", file=sys.stderr)
         sys.exit(1)
-    except FileNotFoundError:
+    except _GPGME_ERRORS as e:
+        print(f"Decryption failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    except GPGNotFoundError:
         print("Error: gpg command not found. Please install GnuPG.", file=sys.stderr)
         sys.exit(1)
+    except FileNotFoundError:
+        print(f"Error: File not found: {file_path}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _require(path: Path, label: str) -> os.stat_result:
+    """Stat a path once, exiting with an error if it does not exist."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        print(f"{label} not found: {path}")
+        sys.exit(1)
 
 
 def secrets(name=""):
@@ -195,28 +272,20 @@ def secrets(name=""):
 
     vault_file_path = home / ".blueprint" / "secrets" / f"{vault_file}.asc"
 
-    # Check if vault file exists
-    if not vault_file_path.exists():
-        print(f"Vault file not found: {vault_file_path}")
-        sys.exit(1)
-
-    # Check if secret file exists
-    if not secret_file.exists():
-        print(f"Secret file not found: {secret_file}")
-        sys.exit(1)
+    # Check both input files with one stat each
+    _require(vault_file_path, "Vault file")
+    _require(secret_file, "Secret file")
 
-    # Get vault password by running: vault -d $VAULT_FILE
-    try:
-        vault_password = subprocess.check_output(  # noqa: S603
-            ["vaultpy", "-d", vault_file.replace(".asc", "")],  # noqa: S607
-            text=True,
-            stderr=subprocess.PIPE,
-        ).strip()
-    except subprocess.CalledProcessError as e:
-        print(f"Error getting vault password: {e}")
-        sys.exit(1)
+    # Get vault password by running: vault -d $VAULT_FILE, piping it
+    # straight into ansible-vault so it never lands in a Python buffer.
+    vaultpy = subprocess.Popen(  # noqa: S603
+        ["vaultpy", "-d", vault_file.replace(".asc", "")],  # noqa: S607
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
 
-    # Run ansible-vault view with password piped to stdin
+    # Run ansible-vault view with the password on stdin
     ansible_vault = subprocess.Popen(  # noqa: S603
         [  # noqa: S607
             "ansible-vault",
@@ -225,33 +294,24 @@ def secrets(name=""):
             "--vault-password-file",
             "/dev/stdin",
         ],
-        stdin=subprocess.PIPE,
+        stdin=vaultpy.stdout,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
     )
+    vault_stdout, vault_stderr = ansible_vault.communicate()
+    _, vaultpy_stderr = vaultpy.communicate()
 
-    # Pipe output to yj
-    yj = subprocess.Popen(
-        ["yj"],  # noqa: S607
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
-
-    # Send password to ansible-vault and pipe its output to yj
-    vault_stdout, vault_stderr = ansible_vault.communicate(input=vault_password)
+    if vaultpy.returncode != 0:
+        print(f"Error getting vault password: {vaultpy_stderr}", file=sys.stderr)
+        sys.exit(1)
 
     if ansible_vault.returncode != 0:
         print(f"Error from ansible-vault: {vault_stderr}", file=sys.stderr)
         sys.exit(1)
 
-    # Send ansible-vault output to yj
-    yj_output, yj_error = yj.communicate(input=vault_stdout)
-
-    if yj.returncode != 0:
-        print(f"Error from yj: {yj_error}", file=sys.stderr)
-        sys.exit(1)
-
-    return json.loads(yj_output)  # Validate JSON
+    # Parse the decrypted YAML directly instead of shelling out to yj
+    # for a YAML -> JSON -> dict round trip.
+    # Safe: _YamlLoader is CSafeLoader/SafeLoader, but ruff cannot resolve
+    # the cross-module alias.
+    return yaml.load(vault_stdout, Loader=_YamlLoader)  # noqa: S506
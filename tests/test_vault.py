@@ -0,0 +1,32 @@
+import string
+
+import pytest
+
+from bpkit.vault import generate_password
+
+
+def test_generate_password_length():
+    assert len(generate_password(length=32)) == 32
+
+
+def test_generate_password_digits_only():
+    password = generate_password(length=64, use_letters=False, use_symbols=False)
+    assert set(password) <= set(string.digits)
+
+
+def test_generate_password_symbols_only():
+    # string.punctuation has 32 characters, hitting the power-of-two
+    # translate fast path rather than rejection sampling.
+    password = generate_password(length=64, use_letters=False, use_digits=False)
+    assert len(password) == 64
+    assert set(password) <= set(string.punctuation)
+
+
+def test_generate_password_rejects_empty_charset():
+    with pytest.raises(ValueError, match="At least one character set"):
+        generate_password(use_letters=False, use_digits=False, use_symbols=False)
+
+
+def test_generate_password_rejects_bad_length():
+    with pytest.raises(ValueError, match="at least 1"):
+        generate_password(length=0)